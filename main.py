@@ -1,91 +1,121 @@
 import sys
 import os
 import re
-import json
-from bs4 import BeautifulSoup, Tag, NavigableString
+import argparse
+import hashlib
+import orjson
+from contextlib import nullcontext
+from zipfile import ZipFile, ZIP_DEFLATED
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
 
 # --- Configuration ---
 BIBLE_DIR = 'WEBBible' # Directory containing index.htm and chapter files
 INDEX_FILE_NAME = 'index.htm'
 OUTPUT_BASE_DIR = 'WEBBibleJSON' # Base directory for the structured output
-
-# --- Verse Extraction Function (Based on previous refinements) ---
-# (This function remains unchanged)
+CACHE_FILE_PATH = '.chapter_cache.json' # Hashes and stats of already converted chapters, kept outside the output directory
+CACHE_VERSION = 2 # Bump whenever the JSON output changes so cached chapters are regenerated
+BUNDLE_FILE_NAME = 'WEBBibleJSON.zip' # Single archive written instead of OUTPUT_BASE_DIR with --bundle
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS # Verse numbers are int keys
+
+# --- Precompiled Patterns ---
+HREF_RE = re.compile(r"([A-Z1-9]+)(\d+)\.htm$", re.IGNORECASE) # First-chapter link in the index
+
+# Chapter files are UTF-8; stating it keeps lxml from falling back to Latin-1 when a file has no charset.
+# A plain etree parser (not lxml.html's) builds element proxies in C, without a Python class lookup per node.
+UTF8_HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+
+# Text directly inside verse-number or words-of-Jesus spans is not collected on its own
+EXCLUDED_SPAN_CLASSES = frozenset(('verse', 'wj'))
+
+# --- Verse Extraction Helpers ---
+def _has_class(element, class_name):
+    """Returns True if the element's class attribute contains class_name."""
+    return class_name in (element.get('class') or '').split()
+
+def _find_element(root, tag, class_name):
+    """Returns the first descendant of root with the given tag and class, or None."""
+    for element in root.iter(tag):
+        if _has_class(element, class_name):
+            return element
+    return None
+
+def _store_verse(verses_dict, verse_number, content_parts):
+    """Normalizes the collected parts of a verse and stores them if non-empty."""
+    if verse_number is None:
+        return
+    full_verse_text = ''.join(content_parts).strip()
+    full_verse_text = full_verse_text.replace('\xa0', ' ')
+    full_verse_text = ' '.join(full_verse_text.split())
+
+    if full_verse_text:
+         verses_dict[verse_number] = full_verse_text.strip()
+
+# --- Verse Extraction Function ---
 def extract_verses_from_html(html_content):
     """
     Parses HTML content of a chapter file and extracts verses.
 
     Args:
-        html_content: String containing the HTML of the chapter.
+        html_content: Bytes (or string) containing the HTML of the chapter.
 
     Returns:
         A dictionary {verse_number (int): verse_text (str)} or None if parsing fails.
     """
     verses_dict = {}
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-        main_content = soup.find('div', class_='main')
-        if not main_content:
-             body_content = soup.find('body')
-             if not body_content: return None
-             main_content = body_content
-
-        for a in main_content.find_all('a'):
-            a.decompose()
-
-        footnote_div = main_content.find('div', class_='footnote')
-        copyright_div = main_content.find('div', class_='copyright')
-
-        verse_tags = main_content.find_all('span', class_='verse')
-        if not verse_tags:
-             return None
-
-        for i, verse_tag in enumerate(verse_tags):
-            try:
-                verse_number_str = verse_tag.get_text(strip=True)
-                verse_number_int = int(verse_number_str)
-            except ValueError:
-                continue
-
-            content_parts = []
-            current_element = verse_tag
-
-            while True:
-                current_element = current_element.next_element
-
-                if current_element is None: break
-                if i + 1 < len(verse_tags) and current_element == verse_tags[i+1]: break
-                if (footnote_div and current_element == footnote_div) or \
-                   (copyright_div and current_element == copyright_div): break
-                is_in_excluded_section = False
-                if isinstance(current_element, (Tag, NavigableString)):
-                    if footnote_div:
-                        for parent in current_element.parents:
-                            if parent == footnote_div: is_in_excluded_section = True; break
-                    if not is_in_excluded_section and copyright_div:
-                        for parent in current_element.parents:
-                             if parent == copyright_div: is_in_excluded_section = True; break
-                if is_in_excluded_section: break
-
-                if isinstance(current_element, Tag):
-                    if current_element.name == 'span' and current_element.get('class') == ['wj']:
-                        content_parts.append(str(current_element))
-                elif isinstance(current_element, NavigableString):
-                    parent = current_element.parent
-                    is_excluded_parent = False
-                    if isinstance(parent, Tag) and parent.name == 'span':
-                        parent_class = parent.get('class')
-                        if parent_class and ('wj' in parent_class or 'verse' in parent_class):
-                             is_excluded_parent = True
-                    if not is_excluded_parent:
-                        content_parts.append(str(current_element))
-
-            full_verse_text = ''.join(content_parts).strip()
-            full_verse_text = full_verse_text.replace('\xa0', ' ')
-            full_verse_text = ' '.join(full_verse_text.split())
-
-            if full_verse_text:
-                 verses_dict[verse_number_int] = full_verse_text.strip()
+        root = etree.fromstring(html_content, parser=UTF8_HTML_PARSER)
+        main_content = _find_element(root, 'div', 'main')
+        if main_content is None:
+             main_content = root.find('body')
+             if main_content is None: return None
+
+        # Drop anchors (footnote markers) together with their contents, keeping the text after them
+        etree.strip_elements(main_content, 'a', with_tail=False)
+
+        # The walk ends at the first footnote/copyright div, so only that one is needed and each node
+        # is tested against it by identity. A chapter without verse spans simply yields an empty dict,
+        # so no separate verse scan is needed.
+        stop_element = next((div for div in main_content.iter('div')
+                             if _has_class(div, 'footnote') or _has_class(div, 'copyright')), None)
+
+        # Single depth-first pass: 'start' sees an element and its text, 'end' sees its tail.
+        # Footnotes and copyright come after the last verse, so reaching either ends the scan.
+        # excluded_stack mirrors the open elements, recording whether each one's own text is excluded.
+        verse_number = None
+        content_parts = []
+        excluded_stack = []
+        for event, element in etree.iterwalk(main_content, events=('start', 'end')):
+            if event == 'start':
+                if element is stop_element: break
+
+                is_excluded = False
+                if element.tag == 'span':
+                    # The class attribute is split once per span and reused by every check below
+                    span_classes = (element.get('class') or '').split()
+                    is_excluded = not EXCLUDED_SPAN_CLASSES.isdisjoint(span_classes)
+
+                    if 'verse' in span_classes:
+                        _store_verse(verses_dict, verse_number, content_parts)
+                        content_parts = []
+                        try:
+                            verse_number = int(''.join(element.itertext()).strip())
+                        except ValueError:
+                            verse_number = None
+                    elif verse_number is not None and span_classes == ['wj']:
+                        # Words of Jesus keep their span markup so red-letter text survives in the JSON
+                        content_parts.append(etree.tostring(element, encoding='unicode', method='html', with_tail=False))
+
+                excluded_stack.append(is_excluded)
+                if verse_number is not None and element.text and not is_excluded:
+                    content_parts.append(element.text)
+            else:
+                excluded_stack.pop()
+                if not excluded_stack: break # Closed main_content itself
+                if verse_number is not None and element.tail and not excluded_stack[-1]:
+                    content_parts.append(element.tail)
+
+        _store_verse(verses_dict, verse_number, content_parts)
 
     except Exception as e:
         print(f"Error parsing chapter content: {e}", file=sys.stderr)
@@ -93,11 +123,217 @@ def extract_verses_from_html(html_content):
 
     return verses_dict if verses_dict else None
 
+# --- Index Parsing Function ---
+def read_book_links(index_file_path):
+    """
+    Streams index.htm and collects the links inside <div class="bookList">.
+    Parsing stops as soon as the book list has been read.
+
+    Returns:
+        A list of (link_classes (list), link_text (str), href (str)) tuples,
+        or None if the index has no book list.
+    """
+    book_links = None
+    # Opening the file here (rather than passing the path) closes it even when parsing stops early
+    with open(index_file_path, 'rb') as index_file:
+        events = etree.iterparse(index_file, events=('start', 'end'), tag=('div', 'a'),
+                                 html=True, encoding='utf-8')
+        for event, element in events:
+            if element.tag == 'div':
+                if _has_class(element, 'bookList'):
+                    if event == 'end': break
+                    book_links = []
+            elif event == 'end':
+                if book_links is not None:
+                    link_text = ''.join(element.itertext()).strip()
+                    book_links.append(((element.get('class') or '').split(), link_text, element.get('href')))
+                element.clear() # Links are not needed once read, keep the streamed tree small
+    return book_links
+
+# --- Chapter File Discovery ---
+def list_html_files(base_dir):
+    """Scans base_dir once and returns the set of .htm file names in it."""
+    with os.scandir(base_dir) as entries:
+        return {entry.name for entry in entries if entry.name.endswith('.htm')}
+
+def find_chapter_files(base_dir, html_files, base_code, start_chapter, padding):
+    """
+    Lists a book's chapter files exactly as the index names them: base_code followed by
+    a chapter number zero-padded to `padding` digits, counting up from start_chapter
+    until a chapter is missing.
+
+    Returns:
+        A list of (chapter_num (int), chapter_filepath (str)) tuples in chapter order.
+    """
+    chapter_files = []
+    chapter_num = start_chapter
+    while True:
+        chapter_filename_only = f"{base_code}{chapter_num:0{padding}d}.htm"
+        if chapter_filename_only not in html_files:
+            return chapter_files # End of chapters for this book
+        chapter_files.append((chapter_num, os.path.join(base_dir, chapter_filename_only)))
+        chapter_num += 1
+
+# --- Output Writing ---
+# O_BINARY only exists on Windows, where it stops newline translation
+WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+def write_file_bytes(path, data):
+    """
+    Writes data to path with raw os.write calls, bypassing Python's buffered file objects.
+    Output files are small, so this is normally a single write.
+    """
+    fd = os.open(path, WRITE_FLAGS, 0o666) # Same mode open() uses; the umask still applies
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+# --- Chapter Cache ---
+def load_chapter_cache(cache_file_path, output_dir):
+    """
+    Loads the chapter entries a previous run saved to cache_file_path.
+    The cache is only valid for the output_dir recorded inside it.
+
+    Returns:
+        A dictionary {chapter_filepath (str): {'hash': str, 'mtime_ns': int, 'size': int}},
+        empty if there is no usable cache for output_dir.
+    """
+    try:
+        with open(cache_file_path, 'rb') as cache_file:
+            cache_data = orjson.loads(cache_file.read())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        print(f"Warning: Ignoring unreadable cache file '{cache_file_path}': {e}", file=sys.stderr)
+        return {}
+
+    if not isinstance(cache_data, dict) or cache_data.get('version') != CACHE_VERSION or \
+       cache_data.get('output_dir') != os.path.abspath(output_dir):
+        return {}
+    return cache_data.get('chapters', {})
+
+def save_chapter_cache(cache_file_path, output_dir, chapter_entries):
+    """Writes the chapter entries to cache_file_path, recording the output_dir they are valid for."""
+    cache_data = {'version': CACHE_VERSION, 'output_dir': os.path.abspath(output_dir), 'chapters': chapter_entries}
+    try:
+        write_file_bytes(cache_file_path, orjson.dumps(cache_data, option=orjson.OPT_SORT_KEYS))
+    except OSError as e:
+        print(f"Warning: Could not write cache file '{cache_file_path}': {e}", file=sys.stderr)
+
+# --- Book Processing Functions ---
+def _read_chapter(chapter_filepath):
+    """Returns the raw bytes of a chapter file; lxml decodes the UTF-8 itself, in C."""
+    with open(chapter_filepath, 'rb') as chapter_file:
+        return chapter_file.read()
+
+def _convert_chapter(file_content):
+    """
+    Extracts the verses of one chapter and serializes them up front, so the JSON can be
+    stored with a single write.
+
+    Returns:
+        The chapter JSON as UTF-8 bytes, or None if the chapter has no verses.
+    """
+    verses_dict = extract_verses_from_html(file_content)
+    if not verses_dict:
+        return None
+    return orjson.dumps(verses_dict, option=JSON_OPTIONS)
+
+def process_book(book_name, chapter_files, book_dir_path, cached_chapters):
+    """
+    Extracts every chapter of a single book and saves each one as JSON in book_dir_path.
+    Runs in a worker process, so it only depends on its arguments.
+
+    Args:
+        chapter_files: Sorted list of (chapter_num, chapter_filepath) tuples for the book.
+        cached_chapters: Cache entries from the previous run, {chapter_filepath: {'hash', 'mtime_ns', 'size'}}.
+
+    Returns:
+        A tuple (chapters saved for the book, cache entries for those chapters).
+    """
+    chapters_processed_for_book = 0
+    chapter_entries = {}
+    for chapter_num, chapter_filepath in chapter_files:
+        output_json_path = os.path.join(book_dir_path, f"{chapter_num}.json")
+        try:
+            # The source's own stat is compared with the one recorded when it was converted, so an
+            # unchanged chapter is skipped without reading it. The JSON's mtime proves nothing here.
+            source_stat = os.stat(chapter_filepath)
+            cached_entry = cached_chapters.get(chapter_filepath)
+            output_exists = os.path.exists(output_json_path)
+            if cached_entry and output_exists and cached_entry['mtime_ns'] == source_stat.st_mtime_ns and \
+               cached_entry['size'] == source_stat.st_size:
+                chapter_entries[chapter_filepath] = cached_entry
+                chapters_processed_for_book += 1
+                continue
+
+            file_content = _read_chapter(chapter_filepath)
+            chapter_entry = {'hash': hashlib.blake2b(file_content).hexdigest(),
+                             'mtime_ns': source_stat.st_mtime_ns, 'size': source_stat.st_size}
+
+            # A touched but unchanged chapter needs neither parsing nor writing; storing its
+            # new stat lets the next run skip it without hashing
+            if cached_entry and output_exists and cached_entry['hash'] == chapter_entry['hash']:
+                chapter_entries[chapter_filepath] = chapter_entry
+                chapters_processed_for_book += 1
+                continue
+
+            json_bytes = _convert_chapter(file_content)
+
+            if json_bytes:
+                # Write the verses to the chapter JSON file
+                try:
+                    write_file_bytes(output_json_path, json_bytes)
+                    chapter_entries[chapter_filepath] = chapter_entry
+                    chapters_processed_for_book += 1
+                except IOError as e:
+                    print(f"  Error writing JSON file '{output_json_path}': {e}", file=sys.stderr)
+                except Exception as e:
+                    print(f"  Unexpected error writing JSON for chapter {chapter_num} of {book_name}: {e}", file=sys.stderr)
+
+        except Exception as e:
+            print(f"  Error processing chapter file '{chapter_filepath}': {e}", file=sys.stderr)
+            break # Stop processing this book on other errors
+
+    return chapters_processed_for_book, chapter_entries
+
+def bundle_book(chapter_files):
+    """
+    Extracts every chapter of a single book for the bundle archive.
+    Nothing is written here; the parent process adds the results to the zip file.
+
+    Args:
+        chapter_files: Sorted list of (chapter_num, chapter_filepath) tuples for the book.
+
+    Returns:
+        A list of (chapter_num, json_bytes) tuples for the chapters that contain verses.
+    """
+    chapter_payloads = []
+    for chapter_num, chapter_filepath in chapter_files:
+        try:
+            json_bytes = _convert_chapter(_read_chapter(chapter_filepath))
+
+            if json_bytes:
+                chapter_payloads.append((chapter_num, json_bytes))
+
+        except Exception as e:
+            print(f"  Error processing chapter file '{chapter_filepath}': {e}", file=sys.stderr)
+            break # Stop processing this book on other errors
+
+    return chapter_payloads
+
 # --- Main Processing Logic ---
-def process_and_save_books(base_dir, output_dir):
+def process_and_save_books(base_dir, output_dir, bundle_path=None, cache_file_path=CACHE_FILE_PATH):
     """
     Processes index.htm and chapter files within base_dir,
     saving each chapter's verses to a structured directory in output_dir.
+    If bundle_path is given, the same BookName/chapter.json layout is written
+    into a single zip file there instead, and output_dir is not touched.
+    Unchanged chapters are skipped using the cache at cache_file_path, which
+    is only valid for the output_dir it was written for.
     """
     index_file_path = os.path.join(base_dir, INDEX_FILE_NAME)
 
@@ -105,37 +341,38 @@ def process_and_save_books(base_dir, output_dir):
         print(f"Error: Index file '{index_file_path}' not found.", file=sys.stderr)
         return False
 
-    try:
-        os.makedirs(output_dir, exist_ok=True)
-    except OSError as e:
-        print(f"Error creating base output directory '{output_dir}': {e}", file=sys.stderr)
-        return False
+    if not bundle_path:
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating base output directory '{output_dir}': {e}", file=sys.stderr)
+            return False
 
     processed_books_count = 0
     total_chapters_saved = 0
+    bundle_tmp_path = f"{bundle_path}.tmp" if bundle_path else None
 
     try:
         print(f"Reading index file: {index_file_path}")
-        with open(index_file_path, 'r', encoding='utf-8') as f:
-            index_soup = BeautifulSoup(f, 'html.parser')
-
-        book_list_container = index_soup.find('div', class_='bookList')
-        if not book_list_container:
+        book_links = read_book_links(index_file_path)
+        if book_links is None:
              print(f"Error: Could not find '<div class=\"bookList\">' in {index_file_path}", file=sys.stderr)
              return False
 
-        book_links = book_list_container.find_all('a')
         print(f"Found {len(book_links)} potential book links.")
 
-        for link in book_links:
-            link_class = link.get('class')
-            if link_class and ('oo' in link_class or 'nn' in link_class):
-                book_name = link.get_text(strip=True)
+        html_files = list_html_files(base_dir)
+
+        cached_chapters = load_chapter_cache(cache_file_path, output_dir) if not bundle_path else {}
+        chapter_entries = {}
+
+        book_jobs = []
+        for link_classes, book_name, href in book_links:
+            if 'oo' in link_classes or 'nn' in link_classes:
                 # safe_book_name = book_name.replace(' ', '_').replace(':', '_')
-                href = link.get('href')
                 if not book_name or not href: continue
 
-                match = re.match(r"([A-Z1-9]+)(\d+)\.htm$", href, re.IGNORECASE)
+                match = HREF_RE.match(href)
                 if not match: continue
 
                 base_code = match.group(1).upper()
@@ -143,69 +380,77 @@ def process_and_save_books(base_dir, output_dir):
                 padding = len(first_chapter_num_str)
                 start_chapter = int(first_chapter_num_str)
 
-                print(f"Processing Book: {book_name}")
-                book_dir_path = os.path.join(output_dir, book_name) # Path for BookName directory
+                chapter_files = find_chapter_files(base_dir, html_files, base_code, start_chapter, padding)
 
-                chapters_processed_for_book = 0
-                chapter_num = start_chapter
-                while True:
-                    chapter_num_str = f"{chapter_num:0{padding}d}"
-                    chapter_filename_only = f"{base_code}{chapter_num_str}.htm"
-                    chapter_filepath = os.path.join(base_dir, chapter_filename_only)
-
-                    try:
-                        with open(chapter_filepath, 'r', encoding='utf-8') as chapter_file:
-                            file_content = chapter_file.read()
-
-                        verses_dict = extract_verses_from_html(file_content)
-
-                        if verses_dict:
-                             # Create Book directory only if we have data for its first chapter
-                            if chapters_processed_for_book == 0:
-                                try:
-                                    os.makedirs(book_dir_path, exist_ok=True)
-                                except OSError as e:
-                                     print(f"  Error creating book directory '{book_dir_path}': {e}", file=sys.stderr)
-                                     # Decide if we should stop processing the book or just skip saving
-                                     break # Stop processing this book if its dir can't be made
-
-                            # --- Simplified Path ---
-                            # Define output JSON file path directly in the book directory
-                            output_json_path = os.path.join(book_dir_path, f"{chapter_num}.json")
-
-                            # Write the verses dictionary to the chapter JSON file
-                            try:
-                                with open(output_json_path, 'w', encoding='utf-8') as outfile:
-                                    json.dump(verses_dict, outfile, indent=4, ensure_ascii=False)
-                                chapters_processed_for_book += 1
-                            except IOError as e:
-                                print(f"  Error writing JSON file '{output_json_path}': {e}", file=sys.stderr)
-                            except Exception as e:
-                                print(f"  Unexpected error writing JSON for chapter {chapter_num} of {book_name}: {e}", file=sys.stderr)
-
-                        chapter_num += 1
-
-                    except FileNotFoundError:
-                        break # End of chapters for this book
-                    except Exception as e:
-                        print(f"  Error processing chapter file '{chapter_filepath}': {e}", file=sys.stderr)
-                        break # Stop processing this book on other errors
+                if not chapter_files: continue
 
+                if bundle_path:
+                    book_jobs.append((book_name, bundle_book, (chapter_files,)))
+                    continue
+
+                # Create all Book directories up front so workers only ever write files
+                book_dir_path = os.path.join(output_dir, book_name) # Path for BookName directory
+                try:
+                    os.makedirs(book_dir_path, exist_ok=True)
+                except OSError as e:
+                     print(f"  Error creating book directory '{book_dir_path}': {e}", file=sys.stderr)
+                     continue # Skip this book if its dir can't be made
+
+                book_cached_chapters = {path: cached_chapters[path] for _, path in chapter_files if path in cached_chapters}
+                book_jobs.append((book_name, process_book, (book_name, chapter_files, book_dir_path, book_cached_chapters)))
+
+        # Books are independent of each other, so they are parsed and written in parallel.
+        # In bundle mode workers only parse; the zip file is written here, once, in index order,
+        # under a temporary name that only replaces bundle_path once every book has succeeded.
+        bundle_context = ZipFile(bundle_tmp_path, 'w', compression=ZIP_DEFLATED) if bundle_path else nullcontext()
+        with bundle_context as bundle_zip, ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = []
+            for book_name, worker, worker_args in book_jobs:
+                futures.append((book_name, executor.submit(worker, *worker_args)))
+
+            # Collect results in index order so the log reads the same as a serial run
+            for book_name, future in futures:
+                print(f"Processing Book: {book_name}")
+                if bundle_path:
+                    chapter_payloads = future.result()
+                    for chapter_num, json_bytes in chapter_payloads:
+                        bundle_zip.writestr(f"{book_name}/{chapter_num}.json", json_bytes)
+                    chapters_processed_for_book = len(chapter_payloads)
+                else:
+                    chapters_processed_for_book, book_chapter_entries = future.result()
+                    chapter_entries.update(book_chapter_entries)
                 if chapters_processed_for_book > 0:
                     processed_books_count += 1
                     total_chapters_saved += chapters_processed_for_book
                     print(f"Finished processing {book_name}, saved {chapters_processed_for_book} chapters.")
 
+        if bundle_path:
+            os.replace(bundle_tmp_path, bundle_path)
+        else:
+            # A bundle run leaves the output directory alone, so the cache is only saved here
+            save_chapter_cache(cache_file_path, output_dir, chapter_entries)
+
     except Exception as e:
         print(f"An error occurred during index processing: {e}", file=sys.stderr)
         return False
 
-    print(f"\nFinished processing. Saved {total_chapters_saved} chapters across {processed_books_count} books to '{output_dir}'.")
+    finally:
+        # Never leave a partial archive behind after a failed bundle run
+        if bundle_tmp_path and os.path.exists(bundle_tmp_path):
+            os.remove(bundle_tmp_path)
+
+    print(f"\nFinished processing. Saved {total_chapters_saved} chapters across {processed_books_count} books to '{bundle_path or output_dir}'.")
     return True
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    success = process_and_save_books(BIBLE_DIR, OUTPUT_BASE_DIR)
+    parser = argparse.ArgumentParser(description="Parse the WEB Bible HTML into JSON.")
+    parser.add_argument('--bundle', action='store_true',
+                        help=f"write all chapters into a single '{BUNDLE_FILE_NAME}' instead of '{OUTPUT_BASE_DIR}/'")
+    args = parser.parse_args()
+
+    success = process_and_save_books(BIBLE_DIR, OUTPUT_BASE_DIR,
+                                     bundle_path=BUNDLE_FILE_NAME if args.bundle else None)
 
     if success:
         print("\nProcessing complete.")